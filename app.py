@@ -1,79 +1,360 @@
 import io
-import base64
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import pybase64
 import numpy as np
+from numba import njit, prange
 import matplotlib
 matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-from flask import Flask, jsonify
+import orjson
+import xxhash
+from flask import Flask, Response
 
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.figure import Figure
+from PIL import Image
 
 app = Flask(__name__)
+# set FLASK_ECG_GPU_RENDER=true to draw /plot with VisPy on the GPU; only pays
+# off with many clients polling the server-rendered image
+app.config['ECG_GPU_RENDER'] = False
+app.config.from_prefixed_env()
+
+N_LEADS = 12
+N_SAMPLES = 500
+# (JSON key, lead number) pairs, built once rather than formatted per request
+LEADS = [(f"lead_{i}", i) for i in range(1, N_LEADS + 1)]
+# samples go over the wire as int16 counts of 1/WIRE_SCALE: a +-8 range,
+# well past the R peaks, in half the bytes of float32
+WIRE_SCALE = 4096
+# seconds between ticks of the live signal
+STREAM_INTERVAL = 0.1
+# zlib level 1: these flat two-colour plots barely shrink at the default 6
+PNG_KWARGS = {'compress_level': 1}
+
+# P-QRS-T template pieces, built once; the kernel below reads them as constants
+_P_WAVE = (np.sin(np.linspace(0, np.pi, 10)) * 0.2).astype(np.float32)
+_R_WAVE_BASE = np.linspace(0, 2, 2).astype(np.float32)
+_S_WAVE = (np.linspace(0.5, 0, 2) * 0.3).astype(np.float32)
+_T_WAVE = (np.sin(np.linspace(0, np.pi, 7)) * 0.3).astype(np.float32)
+
+
+# explicit C-contiguous float32 signature: compiled (or loaded from the on-disk
+# cache) at import, so the first ECGData() never pays the JIT cost
+@njit('void(f4[:, ::1], f4[::1])', cache=True, fastmath=True, parallel=True)
+def _build_patterns(out, r_scale):
+    """Add the P-QRS-T complex every 50 samples to each row of out, in place."""
+    n = out.shape[1]
+    for l in prange(out.shape[0]):
+        for i in range(15, n, 50):
+            for j in range(_P_WAVE.size):
+                out[l, i-10+j] += _P_WAVE[j]
+            if i+3 < n:
+                out[l, i] -= 0.2  # Q
+                for j in range(_R_WAVE_BASE.size):
+                    out[l, i+1+j] += _R_WAVE_BASE[j] * r_scale[l]
+            if i+5 < n:
+                for j in range(_S_WAVE.size):
+                    out[l, i+3+j] -= _S_WAVE[j]
+            if i+15 < n:
+                for j in range(_T_WAVE.size):
+                    out[l, i+8+j] += _T_WAVE[j]
+
 
 class ECGData:
     def __init__(self):
-        self.data = {f"lead_{i}": np.zeros(500) for i in range(1, 13)}
+        lead_nums = np.arange(1, N_LEADS + 1)
+        # float32 throughout: the plots resolve far less than 24 bits of mantissa
+        self.freq = (0.4 + (lead_nums * 0.05)).astype(np.float32)
+        self.amplitude = (0.5 + (lead_nums * 0.1) % 1).astype(np.float32)
+        self.phase = (lead_nums * np.pi / 6).astype(np.float32)
+        self.r_scale = (1 + (lead_nums % 3) * 0.5).astype(np.float32)
+        # one row per lead, so every tick is a handful of whole-matrix ops.
+        # Each row is a ring buffer: head is the column of the oldest sample.
+        self.data = np.zeros((N_LEADS, N_SAMPLES), dtype=np.float32)
+        self.head = 0
+        # the two new points sit at x = 0 and 2*pi on every tick, so their
+        # sine baseline is a per-lead constant worth computing only once
+        x_new = np.array([0., 2*np.pi])
+        self._new_base = (np.sin(np.outer(self.freq, x_new) + self.phase[:, None])
+                          * self.amplitude[:, None]).astype(np.float32)
+        self.new_samples = np.empty((N_LEADS, 2), dtype=np.float32)
+        self.rng = np.random.default_rng(seed=0)
+        self._noise_buf = np.empty((N_LEADS, 2), dtype=np.float32)
+        # /stream, /update_ecg and the plot pool all share this instance. _lock
+        # guards the ring buffer and covers one tick or one rotated copy; renders
+        # are serialized per figure by the _plot_locks set up in init_plots
+        self._lock = threading.Lock()
         self.init_data()
+        self.init_plots()
     
     def init_data(self):
-        for lead in self.data:
-            lead_num = int(lead.split('_')[1])
-            freq = 0.4 + (lead_num * 0.05)
-            amplitude = 0.5 + (lead_num * 0.1) % 1
-            phase = lead_num * np.pi / 6
-            x = np.linspace(0, 10*np.pi, 500)
-            self.data[lead] = np.sin(x * freq + phase) * amplitude
-
-            for i in range(15, 500, 50):
-                if i >= 10:
-                    p_wave = np.sin(np.linspace(0, np.pi, 10)) * 0.2
-                    self.data[lead][i-10:i] += p_wave
-                if i+3 < 500:
-                    self.data[lead][i] -= 0.2  # Q
-                    r_wave = np.linspace(0, 2, 2) * (1 + (lead_num % 3) * 0.5)
-                    self.data[lead][i+1:i+3] += r_wave
-                if i+5 < 500:
-                    s_wave = np.linspace(0.5, 0, 2) * 0.3
-                    self.data[lead][i+3:i+5] -= s_wave
-                if i+15 < 500:
-                    t_wave = np.sin(np.linspace(0, np.pi, 7)) * 0.3
-                    self.data[lead][i+8:i+15] += t_wave
-            self.data[lead] += np.random.normal(0, 0.03, 500)
+        x = np.linspace(0, 10*np.pi, N_SAMPLES, dtype=np.float32)
+        self.data[:] = np.sin(np.outer(self.freq, x) + self.phase[:, None]) * self.amplitude[:, None]
+
+        _build_patterns(self.data, self.r_scale)
+        self.data += self.rng.standard_normal(self.data.shape, dtype=np.float32) * np.float32(0.03)
     
     def update_data(self):
-        for lead in self.data:
-            self.data[lead] = np.roll(self.data[lead], -2)
-            lead_num = int(lead.split('_')[1])
-            freq = 0.4 + (lead_num * 0.05)
-            amplitude = 0.5 + (lead_num * 0.1) % 1
-            phase = lead_num * np.pi / 6
-            x = np.linspace(0, 2*np.pi, 2)
-            new_points = np.sin(x * freq + phase) * amplitude
-            if np.random.random() < 0.2:
-                new_points[1] += 1.2 * (1 + (lead_num % 3) * 0.5)
-            new_points += np.random.normal(0, 0.05, 2)
-            self.data[lead][-2:] = new_points
-        return self.data
+        with self._lock:
+            new_points = self.new_samples
+            new_points[:] = self._new_base
+            spikes = self.rng.random(N_LEADS) < 0.2
+            new_points[spikes, 1] += 1.2 * self.r_scale[spikes]
+            # one batched draw for every lead, written into a reused buffer
+            self.rng.standard_normal(dtype=np.float32, out=self._noise_buf)
+            self._noise_buf *= np.float32(0.05)
+            new_points += self._noise_buf
+            # overwrite the two oldest samples instead of shifting the whole buffer;
+            # N_SAMPLES is even and head moves by 2, so the write never wraps
+            self.data[:, self.head:self.head+2] = new_points
+            self.head = (self.head + 2) % N_SAMPLES
+            return new_points.copy()
+
+    def ordered_data(self, lead=None):
+        """Return a copy of the buffer (or of one lead's row), oldest sample first.
+
+        The copy is a consistent snapshot: readers render from it with the buffer
+        lock released, so a tick never waits on a PNG encode.
+        """
+        rows = self.data if lead is None else self.data[lead]
+        with self._lock:
+            return np.roll(rows, -self.head, axis=-1)
+
+    def init_plots(self):
+        # one persistent figure per lead; each render only swaps the y data
+        self._figs = []
+        self._axes = []
+        self._lines = []
+        x = np.arange(N_SAMPLES)
+        for lead_num in range(1, N_LEADS + 1):
+            fig = Figure(figsize=(6, 2), dpi=120)  # wider graph
+            FigureCanvasAgg(fig)
+            ax = fig.add_subplot(111)
+            line, = ax.plot(x, self.data[lead_num - 1], 'g-', linewidth=0.9)
+            ax.set_title(f"Lead {lead_num}", fontsize=10)
+            ax.set_ylim(-2, 2)
+            ax.set_yticks([])
+            ax.set_xticks([])
+            fig.tight_layout(pad=1.0)
+            self._figs.append(fig)
+            self._axes.append(ax)
+            self._lines.append(line)
+        # frame, title and axes never change, so render them once and blit the traces
+        self._backgrounds = [snapshot_background(fig, [line])
+                             for fig, line in zip(self._figs, self._lines)]
+
+        # all 12 leads in one figure, so a tick costs a single PNG encode
+        self._big_fig = Figure(figsize=(12, 12), dpi=100)
+        FigureCanvasAgg(self._big_fig)
+        big_axes = self._big_fig.subplots(6, 2, sharex=True)
+        self._big_lines = []
+        for lead_num, ax in enumerate(big_axes.flat, 1):
+            line, = ax.plot(x, self.data[lead_num - 1], 'g-', linewidth=0.9)
+            ax.set_title(f"Lead {lead_num}", fontsize=10)
+            ax.set_ylim(-2, 2)
+            ax.set_yticks([])
+            ax.set_xticks([])
+            self._big_lines.append(line)
+        self._big_fig.tight_layout(pad=1.0)
+        self._big_background = snapshot_background(self._big_fig, self._big_lines)
+
+        # optional GPURenderer that takes over the combined figure
+        self.gpu_renderer = None
+
+        # lead_num (0 for the combined figure) -> (data fingerprint, base64 PNG)
+        self._plot_cache = {}
+        # one lock per figure, same keys as the cache: a render mutates its lines,
+        # canvas and cache entry, so two renders of one figure must not interleave
+        self._plot_locks = [threading.Lock() for _ in range(N_LEADS + 1)]
+
+    def _cached_plot(self, key, data):
+        # xxh3 over the ordered snapshot is far cheaper than re-rendering identical pixels
+        fp = xxhash.xxh3_64_intdigest(data)
+        cached = self._plot_cache.get(key)
+        if cached is not None and cached[0] == fp:
+            return fp, cached[1]
+        return fp, None
 
     def get_plot_base64(self, lead_num):
-        fig = Figure(figsize=(6, 2))  # wider graph
-        ax = fig.add_subplot(111)
-        lead_key = f"lead_{lead_num}"
-        ax.plot(np.arange(len(self.data[lead_key])), self.data[lead_key], 'g-', linewidth=0.9)
-        ax.set_title(f"Lead {lead_num}", fontsize=10)
-        ax.set_ylim(-2, 2)
-        ax.set_yticks([])
-        ax.set_xticks([])
-        fig.tight_layout(pad=1.0)
+        with self._plot_locks[lead_num]:
+            lead_data = self.ordered_data(lead_num - 1)
+            fp, image_base64 = self._cached_plot(lead_num, lead_data)
+            if image_base64 is not None:
+                return image_base64
+            line = self._lines[lead_num - 1]
+            line.set_ydata(lead_data)
+            png = blit_png(self._figs[lead_num - 1], self._backgrounds[lead_num - 1], [line])
+            image_base64 = pybase64.b64encode(png).decode('ascii')
+            self._plot_cache[lead_num] = (fp, image_base64)
+            return image_base64
+
+    def get_combined_plot_base64(self):
+        w, h = self._big_fig.canvas.get_width_height()
+        with self._plot_locks[0]:
+            ordered = self.ordered_data()
+            fp, image_base64 = self._cached_plot(0, ordered)
+            if image_base64 is not None:
+                return image_base64, w, h
+            if self.gpu_renderer is not None:
+                png = self.gpu_renderer.render_png(ordered)
+            else:
+                for k in range(N_LEADS):
+                    self._big_lines[k].set_ydata(ordered[k])
+                png = blit_png(self._big_fig, self._big_background, self._big_lines)
+            image_base64 = pybase64.b64encode(png).decode('ascii')
+            self._plot_cache[0] = (fp, image_base64)
+            return image_base64, w, h
+
+
+def to_wire(samples):
+    """Quantize float samples to little-endian int16 counts of 1/WIRE_SCALE."""
+    return np.clip(np.rint(samples * WIRE_SCALE), -32768, 32767).astype('<i2')
+
+
+def snapshot_background(fig, lines):
+    """Draw fig without its traces and keep the pixels for later blits."""
+    for line in lines:
+        line.set_visible(False)
+    fig.canvas.draw()
+    background = fig.canvas.copy_from_bbox(fig.bbox)
+    for line in lines:
+        line.set_visible(True)
+    return background
+
+
+def blit_png(fig, background, lines):
+    """Restore the cached background, draw only the traces and encode a PNG."""
+    canvas = fig.canvas
+    canvas.restore_region(background)
+    for line in lines:
+        line.axes.draw_artist(line)
+    buf = io.BytesIO()
+    Image.frombuffer('RGBA', canvas.get_width_height(), canvas.buffer_rgba(),
+                     'raw', 'RGBA', 0, 1).save(buf, format='png', **PNG_KWARGS)
+    return buf.getvalue()
+
+
+class GPURenderer:
+    """Offscreen VisPy (OpenGL) renderer for the combined 12-lead image.
+
+    Needs vispy and a headless EGL driver, neither of which is in
+    requirements.txt. A GL context belongs to the thread that made it, so all
+    GL work runs on one dedicated worker thread.
+    """
+
+    def __init__(self, size):
+        self._gl_thread = ThreadPoolExecutor(max_workers=1)
+        try:
+            self._gl_thread.submit(self._setup, size).result()
+        except Exception:
+            self._gl_thread.shutdown()
+            raise
+
+    def _setup(self, size):
+        import vispy
+        vispy.use(app='egl')
+        from vispy import scene
+
+        self.canvas = scene.SceneCanvas(size=size, show=False, bgcolor='white')
+        grid = self.canvas.central_widget.add_grid(spacing=10, margin=10)
+        self._pos = np.zeros((N_LEADS, N_SAMPLES, 2), dtype=np.float32)
+        self._pos[:, :, 0] = np.arange(N_SAMPLES)
+        self._lines = []
+        for k in range(N_LEADS):
+            # same 6x2 layout and -2..2 range as the Matplotlib figure
+            view = grid.add_view(row=k // 2, col=k % 2, border_color='black')
+            view.camera = scene.PanZoomCamera(rect=(0, -2, N_SAMPLES, 4))
+            scene.visuals.Text(f"Lead {k + 1}", pos=(N_SAMPLES / 2, 1.95), font_size=10,
+                               anchor_y='top', parent=view.scene)
+            self._lines.append(scene.visuals.Line(pos=self._pos[k], color='green', parent=view.scene))
+
+    def _render(self, ordered):
+        self._pos[:, :, 1] = ordered
+        for k, line in enumerate(self._lines):
+            line.set_data(pos=self._pos[k])
         buf = io.BytesIO()
-        fig.savefig(buf, format='png', dpi=120)
-        buf.seek(0)
-        image_base64 = base64.b64encode(buf.getvalue()).decode('utf-8')
-        plt.close(fig)
-        return image_base64
+        Image.fromarray(self.canvas.render()).save(buf, format='png', **PNG_KWARGS)
+        return buf.getvalue()
+
+    def render_png(self, ordered):
+        """Render a (12, 500) oldest-first snapshot and return PNG bytes."""
+        return self._gl_thread.submit(self._render, ordered).result()
+
+
+class TickBroadcaster:
+    """Single producer for the live signal: one thread ticks ECGData every interval.
+
+    /stream and /update_ecg only wait for and forward ticks, so the signal runs
+    at one speed however many clients are connected.
+    """
+
+    def __init__(self, ecg, interval, history=50):
+        self._ecg = ecg
+        self._interval = interval
+        self._cond = threading.Condition()
+        # (seq, int16 wire samples, ready-made SSE event) for the last few seconds
+        self._ticks = deque(maxlen=history)
+        self._seq = 0
+        self._thread = None
+
+    def _run(self):
+        deadline = time.monotonic()
+        while True:
+            wire = to_wire(self._ecg.update_data())
+            event = b"data: " + orjson.dumps(wire.ravel(), option=orjson.OPT_SERIALIZE_NUMPY) + b"\n\n"
+            with self._cond:
+                self._seq += 1
+                self._ticks.append((self._seq, wire, event))
+                self._cond.notify_all()
+            # fixed-rate schedule, so the time spent ticking doesn't stretch the period
+            deadline += self._interval
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                deadline = time.monotonic()  # fell behind; don't burst to catch up
+
+    def _ensure_started(self):
+        # called with _cond held; the clock starts with the first live client
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='ecg-ticker', daemon=True)
+            self._thread.start()
+
+    def latest_seq(self):
+        with self._cond:
+            self._ensure_started()
+            return self._seq
+
+    def wait(self, after):
+        """Block until there are ticks newer than seq after; return them oldest first.
+
+        A client more than history ticks behind skips the oldest of them.
+        """
+        with self._cond:
+            self._ensure_started()
+            self._cond.wait_for(lambda: self._seq > after)
+            return [tick for tick in self._ticks if tick[0] > after]
 
 
 ecg_data = ECGData()
+ticker = TickBroadcaster(ecg_data, STREAM_INTERVAL)
+if app.config['ECG_GPU_RENDER']:
+    try:
+        ecg_data.gpu_renderer = GPURenderer(ecg_data._big_fig.canvas.get_width_height())
+    except Exception as exc:  # no vispy, or no headless GL on this host
+        app.logger.warning("GPU rendering unavailable, using Matplotlib: %s", exc)
+# each lead has its own Figure and lock, so renders of different leads run side
+# by side while overlapping /plot/leads calls queue per lead instead of sharing
+# a canvas; Pillow's zlib and pybase64 both release the GIL while encoding
+plot_pool = ThreadPoolExecutor(max_workers=min(N_LEADS, os.cpu_count() or 1))
+
+def json_response(obj):
+    # orjson skips the stdlib encoder's per-character escaping of the base64 payloads
+    return app.response_class(orjson.dumps(obj), mimetype='application/json')
 
 @app.route('/')
 def index():
@@ -81,11 +362,37 @@ def index():
 
 @app.route('/update_ecg')
 def update_ecg():
-    ecg_data.update_data()
-    plots = {}
-    for i in range(1, 13):
-        plots[f"lead_{i}"] = ecg_data.get_plot_base64(i)
-    return jsonify(plots)
+    # the next tick's raw (12, 2) int16 samples, lead-major; the page draws them itself
+    _, wire, _ = ticker.wait(ticker.latest_seq())[-1]
+    return Response(wire.tobytes(), mimetype='application/octet-stream')
+
+@app.route('/stream')
+def stream():
+    # Server-Sent Events: one long-lived connection per client instead of
+    # ten polls a second; each event is one tick's int16 samples as a JSON list
+    def events():
+        seq = ticker.latest_seq()
+        while True:
+            for seq, _, event in ticker.wait(seq):
+                yield event
+    return Response(events(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+@app.route('/ecg_snapshot')
+def ecg_snapshot():
+    # the whole (12, 500) buffer in the same int16 format, used to seed the canvases on load
+    return Response(to_wire(ecg_data.ordered_data()).tobytes(), mimetype='application/octet-stream')
+
+@app.route('/plot')
+def plot():
+    combined, w, h = ecg_data.get_combined_plot_base64()
+    return json_response({'combined': combined, 'w': w, 'h': h})
+
+@app.route('/plot/leads')
+def plot_leads():
+    futures = [(key, plot_pool.submit(ecg_data.get_plot_base64, num)) for key, num in LEADS]
+    plots = {key: future.result() for key, future in futures}
+    return json_response(plots)
 
 @app.route('/templates/index.html')
 def get_index_template():
@@ -115,10 +422,11 @@ def get_index_template():
                 background: #f9f9f9;
                 box-shadow: 0 0 5px rgba(0,0,0,0.1);
             }
-            .ecg-lead img {
+            .ecg-lead canvas {
                 width: 100%;
                 height: auto;
                 display: block;
+                background: #fff;
             }
         </style>
     </head>
@@ -129,31 +437,92 @@ def get_index_template():
                 f"""
                 <div class="ecg-lead">
                     <h3>Lead {i}</h3>
-                    <img id="lead_{i}" src="/update_ecg" alt="Lead {i}">
+                    <canvas id="lead_{i}" width="{N_SAMPLES}" height="160"></canvas>
                 </div>
-                """ for i in range(1, 13)
+                """ for i in range(1, N_LEADS + 1)
             ]) + """
         </div>
 
         <script>
-            function updateECG() {
-                fetch('/update_ecg')
-                    .then(response => response.json())
-                    .then(data => {
-                        for (let i = 1; i <= 12; i++) {
-                            const img = document.getElementById(`lead_${i}`);
-                            img.src = `data:image/png;base64,${data[`lead_${i}`]}`;
-                        }
-                    })
-                    .catch(error => console.error('Update failed:', error));
+            const N_LEADS = """ + str(N_LEADS) + """;
+            const N_SAMPLES = """ + str(N_SAMPLES) + """;
+            const WIRE_SCALE = """ + str(WIRE_SCALE) + """;
+            const canvases = [];
+            for (let i = 1; i <= N_LEADS; i++) {
+                const canvas = document.getElementById(`lead_${i}`);
+                const ctx = canvas.getContext('2d');
+                ctx.strokeStyle = 'green';
+                ctx.lineWidth = 1;
+                canvases.push(canvas);
+            }
+            const last = new Float32Array(N_LEADS);
+
+            // same -2..2 range as the server-side plots
+            function toY(canvas, v) {
+                return (2 - v) / 4 * canvas.height;
+            }
+
+            function drawLead(l, samples) {
+                const canvas = canvases[l];
+                const ctx = canvas.getContext('2d');
+                ctx.clearRect(0, 0, canvas.width, canvas.height);
+                ctx.beginPath();
+                ctx.moveTo(0, toY(canvas, samples[0]));
+                for (let x = 1; x < samples.length; x++) {
+                    ctx.lineTo(x, toY(canvas, samples[x]));
+                }
+                ctx.stroke();
+                last[l] = samples[samples.length - 1];
+            }
+
+            // samples holds the same number of new points for each lead, lead-major
+            function appendSamples(samples) {
+                const n = samples.length / N_LEADS;
+                for (let l = 0; l < N_LEADS; l++) {
+                    const canvas = canvases[l];
+                    const ctx = canvas.getContext('2d');
+                    const w = canvas.width;
+                    // scroll one pixel per new sample, then draw only the new segment
+                    ctx.globalCompositeOperation = 'copy';
+                    ctx.drawImage(canvas, -n, 0);
+                    ctx.globalCompositeOperation = 'source-over';
+                    ctx.beginPath();
+                    ctx.moveTo(w - n - 1, toY(canvas, last[l]));
+                    for (let j = 0; j < n; j++) {
+                        ctx.lineTo(w - n + j, toY(canvas, samples[l * n + j]));
+                    }
+                    ctx.stroke();
+                    last[l] = samples[l * n + n - 1];
+                }
+            }
+
+            function fromWire(buf) {
+                return Float32Array.from(new Int16Array(buf), s => s / WIRE_SCALE);
             }
 
-            // Faster updates (every 100ms)
-            setInterval(updateECG, 100);
+            fetch('/ecg_snapshot')
+                .then(response => response.arrayBuffer())
+                .then(buf => {
+                    const data = fromWire(buf);
+                    for (let l = 0; l < N_LEADS; l++) {
+                        drawLead(l, data.subarray(l * N_SAMPLES, (l + 1) * N_SAMPLES));
+                    }
+                    // the server pushes a tick every 100ms down one connection
+                    const source = new EventSource('/stream');
+                    source.onmessage = event => appendSamples(
+                        Float32Array.from(JSON.parse(event.data), s => s / WIRE_SCALE));
+                    source.onerror = error => console.error('Stream failed:', error);
+                })
+                .catch(error => console.error('Snapshot failed:', error));
         </script>
     </body>
     </html>
     """
 
+# Development server only. In production run behind a WSGI server with
+# threaded workers, since every open /stream holds a worker thread:
+#   gunicorn -k gthread -w 1 --threads 16 app:app
+# Keep it to one worker: each worker process has its own ECGData and ticker,
+# so with several the page could seed from one signal and stream another.
 if __name__ == '__main__':
-    app.run(debug=True)
+    app.run(threaded=True)